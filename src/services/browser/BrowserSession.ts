@@ -19,12 +19,18 @@ export class BrowserSession {
 	private browser?: Browser
 	private page?: Page
 	private currentMousePosition?: string
+	private chromiumStats?: PCRStats
 
 	constructor(context: vscode.ExtensionContext) {
 		this.context = context
 	}
 
 	private async ensureChromiumExists(): Promise<PCRStats> {
+		// resolving chromium scans the download dir, so only do it once per session
+		if (this.chromiumStats) {
+			return this.chromiumStats
+		}
+
 		const globalStoragePath = this.context?.globalStorageUri?.fsPath
 		if (!globalStoragePath) {
 			throw new Error("Global storage uri is invalid")
@@ -42,9 +48,16 @@ export class BrowserSession {
 			downloadPath: puppeteerDir,
 		})
 
+		this.chromiumStats = stats
 		return stats
 	}
 
+	private getViewport(): { width: number; height: number } {
+		const size = (this.context.globalState.get("browserViewportSize") as string | undefined) || "900x600"
+		const [width, height] = size.split("x").map(Number)
+		return { width, height }
+	}
+
 	async launchBrowser(): Promise<void> {
 		console.log("launch browser called")
 		if (this.browser) {
@@ -58,11 +71,7 @@ export class BrowserSession {
 				"--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
 			],
 			executablePath: stats.executablePath,
-			defaultViewport: (() => {
-				const size = (this.context.globalState.get("browserViewportSize") as string | undefined) || "900x600"
-				const [width, height] = size.split("x").map(Number)
-				return { width, height }
-			})(),
+			defaultViewport: this.getViewport(),
 			// headless: false,
 		})
 		// (latest version of puppeteer does not add headless to user agent)
@@ -247,8 +256,7 @@ export class BrowserSession {
 	}
 
 	async scrollDown(): Promise<BrowserActionResult> {
-		const size = ((await this.context.globalState.get("browserViewportSize")) as string | undefined) || "900x600"
-		const height = parseInt(size.split("x")[1])
+		const { height } = this.getViewport()
 		return this.doAction(async (page) => {
 			await page.evaluate((scrollHeight) => {
 				window.scrollBy({
@@ -261,8 +269,7 @@ export class BrowserSession {
 	}
 
 	async scrollUp(): Promise<BrowserActionResult> {
-		const size = ((await this.context.globalState.get("browserViewportSize")) as string | undefined) || "900x600"
-		const height = parseInt(size.split("x")[1])
+		const { height } = this.getViewport()
 		return this.doAction(async (page) => {
 			await page.evaluate((scrollHeight) => {
 				window.scrollBy({
@@ -0,0 +1,140 @@
+import { BrowserSession } from "../BrowserSession"
+
+jest.mock("vscode")
+jest.mock("fs/promises")
+jest.mock("../../../utils/fs", () => ({
+	fileExistsAtPath: jest.fn().mockResolvedValue(true),
+}))
+jest.mock("puppeteer-core", () => ({
+	TimeoutError: class TimeoutError extends Error {},
+	launch: jest.fn(),
+}))
+jest.mock("puppeteer-chromium-resolver", () => jest.fn())
+
+const PCR = require("puppeteer-chromium-resolver") as jest.Mock
+
+describe("BrowserSession", () => {
+	let session: BrowserSession
+	let viewportSize: string | undefined
+	let mockLaunch: jest.Mock
+	let mockBrowsers: any[]
+
+	const createMockPage = () => ({
+		on: jest.fn(),
+		off: jest.fn(),
+		evaluate: jest.fn().mockResolvedValue(undefined),
+		screenshot: jest.fn().mockResolvedValue("c2NyZWVuc2hvdA=="),
+		url: jest.fn().mockReturnValue("http://localhost:3000/"),
+	})
+
+	const createMockBrowser = () => {
+		const page = createMockPage()
+		const browser = {
+			page,
+			close: jest.fn().mockResolvedValue(undefined),
+			newPage: jest.fn().mockResolvedValue(page),
+		}
+		mockBrowsers.push(browser)
+		return browser
+	}
+
+	beforeEach(() => {
+		jest.clearAllMocks()
+		viewportSize = undefined
+		mockBrowsers = []
+		mockLaunch = jest.fn().mockImplementation(async () => createMockBrowser())
+		PCR.mockResolvedValue({
+			puppeteer: { launch: mockLaunch },
+			executablePath: "/mock/chromium",
+		})
+
+		const mockContext = {
+			globalStorageUri: { fsPath: "/test/global-storage" },
+			globalState: {
+				get: jest.fn().mockImplementation((key: string) =>
+					key === "browserViewportSize" ? viewportSize : undefined,
+				),
+			},
+		}
+		session = new BrowserSession(mockContext as any)
+	})
+
+	it("launches chromium with the configured viewport", async () => {
+		viewportSize = "1280x800"
+
+		await session.launchBrowser()
+
+		expect(mockLaunch).toHaveBeenCalledTimes(1)
+		expect(mockLaunch).toHaveBeenCalledWith(
+			expect.objectContaining({
+				executablePath: "/mock/chromium",
+				defaultViewport: { width: 1280, height: 800 },
+			}),
+		)
+		expect(mockBrowsers[0].newPage).toHaveBeenCalledTimes(1)
+	})
+
+	it("falls back to the default viewport when none is configured", async () => {
+		await session.launchBrowser()
+
+		expect(mockLaunch).toHaveBeenCalledWith(
+			expect.objectContaining({
+				defaultViewport: { width: 900, height: 600 },
+			}),
+		)
+	})
+
+	it("closes the previous browser when launched again", async () => {
+		await session.launchBrowser()
+		viewportSize = "1024x768"
+
+		await session.launchBrowser()
+
+		expect(mockBrowsers[0].close).toHaveBeenCalledTimes(1)
+		expect(mockLaunch).toHaveBeenCalledTimes(2)
+		expect(mockLaunch).toHaveBeenLastCalledWith(
+			expect.objectContaining({
+				defaultViewport: { width: 1024, height: 768 },
+			}),
+		)
+	})
+
+	it("still relaunches when closing the previous browser fails", async () => {
+		await session.launchBrowser()
+		mockBrowsers[0].close.mockRejectedValue(new Error("Target closed"))
+
+		await expect(session.launchBrowser()).resolves.toBeUndefined()
+
+		expect(mockBrowsers[0].close).toHaveBeenCalledTimes(1)
+		expect(mockLaunch).toHaveBeenCalledTimes(2)
+		expect(mockBrowsers[1].newPage).toHaveBeenCalledTimes(1)
+	})
+
+	it("resolves chromium only once per session", async () => {
+		await session.launchBrowser()
+		await session.closeBrowser()
+		await session.launchBrowser()
+
+		expect(mockLaunch).toHaveBeenCalledTimes(2)
+		expect(PCR).toHaveBeenCalledTimes(1)
+	})
+
+	it("resolves chromium again if the first attempt failed", async () => {
+		PCR.mockRejectedValueOnce(new Error("download failed"))
+
+		await expect(session.launchBrowser()).rejects.toThrow("download failed")
+		await session.launchBrowser()
+
+		expect(PCR).toHaveBeenCalledTimes(2)
+		expect(mockLaunch).toHaveBeenCalledTimes(1)
+	})
+
+	it("scrolls by the configured viewport height", async () => {
+		viewportSize = "1024x768"
+		await session.launchBrowser()
+
+		await session.scrollDown()
+
+		expect(mockBrowsers[0].page.evaluate).toHaveBeenCalledWith(expect.any(Function), 768)
+	})
+})